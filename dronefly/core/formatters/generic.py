@@ -3,6 +3,7 @@
 Anything more complicated than plain text can be rendered in Markdown,
 which is then fairly easy to render to other formats as needed.
 """
+from functools import lru_cache
 import re
 from typing import List, Union
 
@@ -32,10 +33,46 @@ MEANS_LABEL_EMOJI = {
     "introduced": "\N{UP-POINTING SMALL RED TRIANGLE}",
 }
 
+# Description and emoji (with trailing thin space) for each means label:
+_MEANS_INFO = {
+    label: (description, MEANS_LABEL_EMOJI[label] + "\u202f")
+    for label, description in MEANS_LABEL_DESC.items()
+}
+
 TAXON_LIST_DELIMITER = [", ", " > "]
 
+_OBS_URL_PREFIX = WWW_BASE_URL + "/observations?taxon_id="
+_LISTED_PREFIX = WWW_BASE_URL + "/listed_taxa/"
+
+_DIGIT_RE = re.compile(r"[0-9]")
+
+_GENUS_LEVEL = RANK_LEVELS["genus"]
+_SPECIES_LEVEL = RANK_LEVELS["species"]
+_PRIMARY_RANKS = frozenset(TAXON_PRIMARY_RANKS)
+_TRI_MID = {rank: f"* {abbr} *" for rank, abbr in TRINOMIAL_ABBR.items()}
+
 p = inflect.engine()
 
+# Marks a cached value that has not been computed yet (None is a valid result)
+_UNSET = object()
+
+_OBS_SINGULAR = "observation"
+_OBS_PLURAL = p.plural(_OBS_SINGULAR, 2)
+
+
+@lru_cache(maxsize=64)
+def _a_rank(rank: str):
+    return p.a(rank)
+
+
+@lru_cache(maxsize=16)
+def _digit_word(digit: str):
+    return p.number_to_words(digit)
+
+
+def _obs_word(count: int):
+    return _OBS_SINGULAR if count == 1 else _OBS_PLURAL
+
 
 def format_link(link_text: str, url: str):
     return f"[{link_text}]({url})" if url else link_text
@@ -64,18 +101,16 @@ def format_taxon_establishment_means(
         and link to establishment means on the web.
     """
     label = means.establishment_means
-    description = MEANS_LABEL_DESC.get(label)
-    if description is None:
+    info = _MEANS_INFO.get(label)
+    if info is None:
         if not all_means:
             return None
         full_description = f"Establishment means {label} in {means.place.display_name}"
+        emoji = ""
     else:
+        description, emoji = info
         full_description = f"{description} {means.place.display_name}"
-    try:
-        emoji = MEANS_LABEL_EMOJI[means.establishment_means] + "\u202f"
-    except KeyError:
-        emoji = ""
-    url = f"{WWW_BASE_URL}/listed_taxa/{means.id}"
+    url = _LISTED_PREFIX + str(means.id)
     if list_title and isinstance(means, ListedTaxon) and means.list.title:
         _means = f"{emoji}{full_description} {format_link(means.list.title, url)}"
     else:
@@ -113,12 +148,11 @@ def format_taxon_conservation_status(
         linked_status = format_link(description, status.url)
         if inflect:
             # inflect statuses with single digits in them correctly
-            first_word = re.sub(
-                r"[0-9]",
-                " {0} ".format(p.number_to_words(r"\1")),
+            first_word = _DIGIT_RE.sub(
+                lambda match: f" {_digit_word(match.group(0))} ",
                 description,
-            ).split()[0]
-            article = p.a(first_word).split()[0]
+            ).split(None, 1)[0]
+            article = p.a(first_word).split(None, 1)[0]
             full_description = " ".join((article, linked_status))
         else:
             full_description = linked_status
@@ -168,36 +202,40 @@ def format_taxon_names(
     """
 
     delimiter = TAXON_LIST_DELIMITER[int(hierarchy)]
+    if max_len and not hasattr(taxa, "__len__"):
+        # Count of taxa is needed for "and # more" if they don't all fit
+        taxa = list(taxa)
 
-    names = [
+    # Format lazily so that names past the point of overflow are never formatted
+    names = (
         format_taxon_name(taxon, with_term=with_term, hierarchy=hierarchy, lang=lang)
         for taxon in taxa
-    ]
+    )
 
     def fit_names(names):
         names_fit = []
         # Account for space already used by format string (minus 2 for %s)
         available_len = max_len - (len(names_format) - 2)
 
+        # Length of names_fit so far, each followed by a delimiter
+        current_len = 0
+        dlen = len(delimiter)
+
         def more(count):
             return "and %d more" % count
 
-        def formatted_len(name):
-            return sum(len(item) + len(delimiter) for item in names_fit) + len(name)
-
-        def overflow(name):
-            return formatted_len(name) > available_len
-
         for name in names:
-            if overflow(name):
-                unprocessed = len(names) - len(names_fit)
-                while overflow(more(unprocessed)):
+            if current_len + len(name) > available_len:
+                unprocessed = len(taxa) - len(names_fit)
+                while current_len + len(more(unprocessed)) > available_len:
                     unprocessed += 1
+                    current_len -= len(names_fit[-1]) + dlen
                     del names_fit[-1]
                 names_fit.append(more(unprocessed))
                 break
             else:
                 names_fit.append(name)
+                current_len += len(name) + dlen
         return names_fit
 
     if max_len:
@@ -213,6 +251,7 @@ def format_taxon_name(
     with_rank=True,
     with_common=True,
     lang=None,
+    preferred_common_name=_UNSET,
 ):
     """Format taxon name.
 
@@ -233,6 +272,9 @@ def format_taxon_name(
     lang: str, optional
         If specified, prefer the first name with its locale == lang instead of
         the preferred_common_name.
+    preferred_common_name: str, optional
+        If specified (even as None), use instead of looking up the preferred
+        common name.
 
     Returns
     -------
@@ -249,15 +291,8 @@ def format_taxon_name(
     """
 
     if with_common:
-        preferred_common_name = None
-        if lang and taxon.names:
-            name = next(
-                iter([name for name in taxon.names if name.get("locale") == lang]), None
-            )
-            if name:
-                preferred_common_name = name.get("name")
-        if not preferred_common_name:
-            preferred_common_name = taxon.preferred_common_name
+        if preferred_common_name is _UNSET:
+            preferred_common_name = _preferred_common_name(taxon, lang)
         if with_term:
             common = (
                 taxon.matched_term
@@ -276,35 +311,47 @@ def format_taxon_name(
     rank = taxon.rank
     rank_level = RANK_LEVELS[rank]
 
-    if rank_level <= RANK_LEVELS["genus"]:
+    if rank_level <= _GENUS_LEVEL:
         name = f"*{name}*"
-    if rank_level > RANK_LEVELS["species"]:
+    if rank_level > _SPECIES_LEVEL:
         if hierarchy:
-            bold = ("\n> **", "**") if rank in TAXON_PRIMARY_RANKS else ("", "")
+            bold = ("\n> **", "**") if rank in _PRIMARY_RANKS else ("", "")
             name = f"{bold[0]}{name}{bold[1]}"
         elif with_rank:
             name = f"{rank.capitalize()} {name}"
     else:
-        if rank in TRINOMIAL_ABBR:
-            tri = name.split(" ")
-            if len(tri) == 3:
+        if rank in _TRI_MID:
+            tri = name.split(" ", 2)
+            if len(tri) == 3 and " " not in tri[2]:
                 # Note: name already italicized, so close/reopen italics around insertion.
-                name = f"{tri[0]} {tri[1]}* {TRINOMIAL_ABBR[rank]} *{tri[2]}"
+                name = tri[0] + " " + tri[1] + _TRI_MID[rank] + tri[2]
     full_name = f"{name} ({common})" if common else name
     if not taxon.is_active:
         full_name += " \N{HEAVY EXCLAMATION MARK SYMBOL} Inactive Taxon"
     return full_name
 
 
+def _preferred_common_name(taxon: Taxon, lang: str = None):
+    """Get the first common name for lang, or else the preferred common name."""
+    if lang and taxon.names:
+        name = next((name for name in taxon.names if name.get("locale") == lang), None)
+        if name and name.get("name"):
+            return name["name"]
+    return taxon.preferred_common_name
+
+
 def _full_means(taxon: Taxon):
     """Get the full establishment means for the place from listed taxa."""
     place = taxon.establishment_means and taxon.establishment_means.place
     listed_taxa = taxon.listed_taxa
     if place and listed_taxa:
         return next(
-            listed_taxon
-            for listed_taxon in listed_taxa
-            if (listed_taxon.place and listed_taxon.place.id) == place.id
+            (
+                listed_taxon
+                for listed_taxon in listed_taxa
+                if (listed_taxon.place and listed_taxon.place.id) == place.id
+            ),
+            None,
         )
 
 
@@ -334,11 +381,15 @@ def format_quality_grade(options: dict = {}):
 
 
 class BaseFormatter:
+    __slots__ = ()
+
     def format():
         raise NotImplementedError
 
 
 class BaseCountFormatter(BaseFormatter):
+    __slots__ = ()
+
     def count():
         raise NotImplementedError
 
@@ -347,6 +398,18 @@ class BaseCountFormatter(BaseFormatter):
 
 
 class TaxonFormatter(BaseFormatter):
+    __slots__ = (
+        "taxon",
+        "lang",
+        "with_url",
+        "matched_term",
+        "max_len",
+        "newline",
+        "obs_count_formatter",
+        "_pcn",
+        "_full_means_cache",
+    )
+
     def __init__(
         self,
         taxon: Taxon,
@@ -379,6 +442,22 @@ class TaxonFormatter(BaseFormatter):
         self.max_len = max_len
         self.newline = newline
         self.obs_count_formatter = self.ObsCountFormatter(taxon)
+        self._pcn = _UNSET
+        self._full_means_cache = _UNSET
+
+    @property
+    def preferred_common_name(self):
+        """The common name for lang, if any, or else the preferred common name."""
+        if self._pcn is _UNSET:
+            self._pcn = _preferred_common_name(self.taxon, self.lang)
+        return self._pcn
+
+    @property
+    def full_means(self):
+        """The listed taxon for the establishment means place, if any."""
+        if self._full_means_cache is _UNSET:
+            self._full_means_cache = _full_means(self.taxon)
+        return self._full_means_cache
 
     def format(self, with_ancestors: bool = True):
         """Format the taxon as markdown.
@@ -386,18 +465,19 @@ class TaxonFormatter(BaseFormatter):
         with_ancestors: bool, optional
             When False, omit ancestors
         """
-        description = self.newline.join(
-            [self.format_title(), self.format_taxon_description()]
-        )
+        parts = [self.format_title(), self.newline, self.format_taxon_description()]
         if with_ancestors and self.taxon.ancestors:
-            description += " in: " + format_taxon_names(
-                self.taxon.ancestors,
-                hierarchy=True,
-                max_len=self.max_len,
+            parts.append(
+                " in: "
+                + format_taxon_names(
+                    self.taxon.ancestors,
+                    hierarchy=True,
+                    max_len=self.max_len,
+                )
             )
         else:
-            description += "."
-        return description
+            parts.append(".")
+        return "".join(parts)
 
     def format_title(self):
         """Format taxon title as Discord-like markdown.
@@ -416,33 +496,20 @@ class TaxonFormatter(BaseFormatter):
             - "Picoides pubescens" ->
                 "*Dryobates Pubescens* (Downy woodpecker) (~~Picoides Pubescens~~)
         """
-        title = format_taxon_name(self.taxon, lang=self.lang)
+        preferred_common_name = self.preferred_common_name
+        title = format_taxon_name(
+            self.taxon, lang=self.lang, preferred_common_name=preferred_common_name
+        )
         if self.with_url and self.taxon.url:
             title = format_link(title, self.taxon.url)
         # TODO: Remove workaround for outstanding pyinat issue #448 when it is resolved:
         # - https://github.com/pyinat/pyinaturalist/issues/448
         matched = self.matched_term or self.taxon.matched_term
-        preferred_common_name = self.taxon.preferred_common_name
-        if self.lang and self.taxon.names:
-            name = next(
-                iter(
-                    [
-                        name
-                        for name in self.taxon.names
-                        if name.get("locale") == self.lang
-                    ]
-                ),
-                None,
-            )
-            if name:
-                preferred_common_name = name.get("name")
         if matched not in (None, self.taxon.name, preferred_common_name):
-            invalid_names = (
-                [name["name"] for name in self.taxon.names if not name["is_valid"]]
-                if self.taxon.names
-                else []
-            )
-            if matched in invalid_names:
+            if self.taxon.names and any(
+                not name["is_valid"] and name["name"] == matched
+                for name in self.taxon.names
+            ):
                 matched = f"~~{matched}~~"
             title += f" ({matched})"
         return title
@@ -453,7 +520,7 @@ class TaxonFormatter(BaseFormatter):
         n_observations = self.obs_count_formatter.description()
         description = f"is {a_status_rank} with {n_observations}"
         if self.taxon.establishment_means:
-            listed_taxon = _full_means(self.taxon) or self.taxon.establishment_means
+            listed_taxon = self.full_means or self.taxon.establishment_means
             established_in_place = format_taxon_establishment_means(listed_taxon)
             if established_in_place:
                 description = f"{description} {established_in_place}"
@@ -470,10 +537,12 @@ class TaxonFormatter(BaseFormatter):
             )
             a_status_rank = f"{a_status} {self.taxon.rank}"
         else:
-            a_status_rank = p.a(self.taxon.rank)
+            a_status_rank = _a_rank(self.taxon.rank)
         return a_status_rank
 
     class ObsCountFormatter(BaseCountFormatter):
+        __slots__ = ("taxon",)
+
         def __init__(self, taxon: Taxon):
             self.taxon = taxon
 
@@ -482,7 +551,7 @@ class TaxonFormatter(BaseFormatter):
 
         def description(self):
             count = self.link()
-            return f"{count} {p.plural('observation', count)}"
+            return f"{count} {_obs_word(self.count())}"
 
         def link(self):
             obs_count = self.count()
@@ -491,4 +560,4 @@ class TaxonFormatter(BaseFormatter):
             return count
 
         def url(self):
-            return WWW_BASE_URL + f"/observations?taxon_id={self.taxon.id}"
+            return _OBS_URL_PREFIX + str(self.taxon.id)
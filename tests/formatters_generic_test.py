@@ -0,0 +1,150 @@
+"""Tests for generic formatters."""
+from pyinaturalist import ConservationStatus, Taxon
+
+from dronefly.core.formatters.generic import (
+    format_taxon_conservation_status,
+    format_taxon_name,
+    format_taxon_names,
+    TaxonFormatter,
+)
+
+
+# pylint: disable=missing-class-docstring disable=no-self-use disable=missing-function-docstring
+class TestConservationStatus:
+    def _status(self, status_name, status):
+        return ConservationStatus(
+            status_name=status_name, status=status, url="https://example.org/status"
+        )
+
+    def test_brief_inflect_digit(self):
+        status = self._status("8 critically imperiled", "8")
+        assert format_taxon_conservation_status(status, brief=True, inflect=True) == (
+            "an [8 critically imperiled (8)](https://example.org/status)"
+        )
+
+    def test_brief_inflect_digits(self):
+        # Each digit is spelled out, so "80" is inflected as "eight zero"
+        status = self._status("80 declining", "80")
+        assert format_taxon_conservation_status(status, brief=True, inflect=True) == (
+            "an [80 declining (80)](https://example.org/status)"
+        )
+
+    def test_brief_inflect_word(self):
+        status = self._status("endangered", "EN")
+        assert format_taxon_conservation_status(status, brief=True, inflect=True) == (
+            "an [endangered (EN)](https://example.org/status)"
+        )
+
+
+class TestTaxonName:
+    def test_trinomial(self):
+        taxon = Taxon(
+            id=1, name="Anser anser domesticus", rank="variety", is_active=True
+        )
+        assert format_taxon_name(taxon) == "*Anser anser* var. *domesticus*"
+
+    def test_trinomial_rank_with_four_names(self):
+        taxon = Taxon(id=1, name="Aa bb cc dd", rank="subspecies", is_active=True)
+        assert format_taxon_name(taxon) == "*Aa bb cc dd*"
+
+
+class TestTaxonNames:
+    def test_names_max_len_from_iterable(self):
+        taxa = (
+            Taxon(id=i, name=f"Genus{i}", rank="genus", is_active=True)
+            for i in range(5)
+        )
+        assert format_taxon_names(taxa, max_len=30) == ("Genus *Genus0*, and 4 more")
+
+
+class TestObsCountFormatter:
+    def _description(self, count):
+        taxon = Taxon(id=3, name="Aves", rank="class", observations_count=count)
+        return TaxonFormatter.ObsCountFormatter(taxon).description()
+
+    def test_description_zero(self):
+        assert self._description(0) == (
+            "[0](https://www.inaturalist.org/observations?taxon_id=3) observations"
+        )
+
+    def test_description_one(self):
+        assert self._description(1) == (
+            "[1](https://www.inaturalist.org/observations?taxon_id=3) observation"
+        )
+
+    def test_description_two(self):
+        assert self._description(2) == (
+            "[2](https://www.inaturalist.org/observations?taxon_id=3) observations"
+        )
+
+
+class TestTaxonFormatter:
+    def test_description_means_not_in_listed_taxa(self):
+        taxon = Taxon(
+            id=3,
+            name="Aves",
+            rank="class",
+            observations_count=2,
+            establishment_means={
+                "id": 1,
+                "establishment_means": "native",
+                "place": {"id": 1, "display_name": "Earth"},
+            },
+            listed_taxa=[
+                {
+                    "id": 2,
+                    "establishment_means": "introduced",
+                    "place": {"id": 2, "display_name": "Mars"},
+                }
+            ],
+        )
+        formatter = TaxonFormatter(taxon)
+        assert formatter.full_means is None
+        assert formatter.format_taxon_description().endswith(
+            "[native in Earth](https://www.inaturalist.org/listed_taxa/1)"
+        )
+
+    def test_title_lang_without_common_name(self):
+        class CountingList(list):
+            iterations = 0
+
+            def __iter__(self):
+                CountingList.iterations += 1
+                return super().__iter__()
+
+        names = CountingList([{"name": "Foo bar", "locale": "sci", "is_valid": True}])
+        taxon = Taxon(id=1, name="Foo bar", rank="species", is_active=True, names=names)
+        assert TaxonFormatter(taxon, lang="fr").format_title() == (
+            "[*Foo bar*](https://www.inaturalist.org/taxa/1)"
+        )
+        assert CountingList.iterations == 1
+
+    def _title_taxon(self):
+        return Taxon(
+            id=1,
+            name="Dryobates pubescens",
+            rank="species",
+            is_active=True,
+            preferred_common_name="Downy Woodpecker",
+            names=[
+                {"name": "Dryobates pubescens", "locale": "sci", "is_valid": True},
+                {"name": "Picoides pubescens", "locale": "sci", "is_valid": False},
+                {"name": "Pic mineur", "locale": "fr", "is_valid": True},
+            ],
+        )
+
+    def test_title_matched_invalid_name(self):
+        formatter = TaxonFormatter(
+            self._title_taxon(), matched_term="Picoides pubescens"
+        )
+        assert formatter.format_title() == (
+            "[*Dryobates pubescens* (Downy Woodpecker)]"
+            "(https://www.inaturalist.org/taxa/1) (~~Picoides pubescens~~)"
+        )
+
+    def test_title_matched_valid_name(self):
+        formatter = TaxonFormatter(self._title_taxon(), matched_term="Pic mineur")
+        assert formatter.format_title() == (
+            "[*Dryobates pubescens* (Downy Woodpecker)]"
+            "(https://www.inaturalist.org/taxa/1) (Pic mineur)"
+        )